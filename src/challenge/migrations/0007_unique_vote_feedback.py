@@ -0,0 +1,30 @@
+# Generated by Django 3.0.5 on 2026-10-14 15:35
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def remove_duplicates(apps, schema_editor):
+    for model_name in ('ChallengeFeedback', 'ChallengeVote'):
+        model = apps.get_model('challenge', model_name)
+        latest = model.objects.values('user', 'challenge').annotate(latest=Max('id')).values('latest')
+        model.objects.exclude(id__in=latest).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenge', '0006_tag'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='challengefeedback',
+            constraint=models.UniqueConstraint(fields=('user', 'challenge'), name='unique_user_challenge_feedback'),
+        ),
+        migrations.AddConstraint(
+            model_name='challengevote',
+            constraint=models.UniqueConstraint(fields=('user', 'challenge'), name='unique_user_challenge_vote'),
+        ),
+    ]
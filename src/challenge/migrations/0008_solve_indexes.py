@@ -0,0 +1,21 @@
+# Generated by Django 3.0.5 on 2026-10-14 15:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenge', '0007_unique_vote_feedback'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='solve',
+            index=models.Index(fields=['challenge', 'team', 'correct'], name='solve_challenge_team_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='solve',
+            index=models.Index(condition=models.Q(correct=True), fields=['challenge'], name='solve_correct_idx'),
+        ),
+    ]
@@ -2,7 +2,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.postgres.fields import JSONField
 from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
-from django.db.models import SET_NULL, CASCADE, PROTECT, Case, When, Value, UniqueConstraint, Q, Subquery
+from django.db.models import SET_NULL, CASCADE, PROTECT, Case, When, Value, UniqueConstraint, Q, Subquery, Index, \
+    Exists, OuterRef
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -77,7 +78,9 @@ class Challenge(models.Model):
             challenges = Challenge.objects.annotate(
                 unlocked=Case(
                     When(auto_unlock=True, then=Value(True)),
-                    When(unlocked_by__in=Subquery(solved_challenges), then=Value(True)),
+                    When(Exists(Challenge.unlocked_by.through.objects.filter(
+                        to_challenge_id=OuterRef("pk"), from_challenge_id__in=solved_challenges
+                    )), then=Value(True)),
                     default=Value(False),
                     output_field=models.BooleanField(),
                 ),
@@ -114,12 +117,22 @@ class ChallengeVote(models.Model):
     user = models.ForeignKey(get_user_model(), on_delete=CASCADE)
     positive = models.BooleanField()
 
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=["user", "challenge"], name="unique_user_challenge_vote"),
+        ]
+
 
 class ChallengeFeedback(models.Model):
     challenge = models.ForeignKey(Challenge, on_delete=CASCADE)
     user = models.ForeignKey(get_user_model(), on_delete=CASCADE)
     feedback = models.TextField()
 
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=["user", "challenge"], name="unique_user_challenge_feedback"),
+        ]
+
 
 @receiver(post_save, sender=Challenge)
 def on_challenge_update(sender, instance, created, **kwargs):
@@ -165,7 +178,11 @@ class Solve(models.Model):
                 name="unique_member_challenge_correct",
             ),
         ]
-        indexes = [BrinIndex(fields=["challenge"], autosummarize=True)]
+        indexes = [
+            BrinIndex(fields=["challenge"], autosummarize=True),
+            Index(fields=["challenge", "team", "correct"], name="solve_challenge_team_idx"),
+            Index(fields=["challenge"], condition=Q(correct=True), name="solve_correct_idx"),
+        ]
 
 
 class File(models.Model):
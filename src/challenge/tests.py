@@ -5,7 +5,7 @@ from rest_framework.status import HTTP_200_OK, HTTP_403_FORBIDDEN, HTTP_401_UNAU
     HTTP_400_BAD_REQUEST
 from rest_framework.test import APITestCase
 
-from challenge.models import Category, Challenge, Solve
+from challenge.models import Category, Challenge, Solve, ChallengeVote, ChallengeFeedback
 from config import config
 from hint.models import Hint, HintUse
 from team.models import Team
@@ -197,6 +197,42 @@ class ChallengeTestCase(ChallengeSetupMixin, APITestCase):
         self.assertFalse(self.challenge2.is_solved(user4))
 
 
+class ChallengeVoteFeedbackTestCase(ChallengeSetupMixin, APITestCase):
+
+    def setUp(self):
+        super(ChallengeVoteFeedbackTestCase, self).setUp()
+        Solve(team=self.team, challenge=self.challenge2, solved_by=self.user, flag='ractf{a}').save()
+        self.client.force_authenticate(user=self.user)
+
+    def test_vote_unsolved(self):
+        response = self.client.post(reverse('vote'), {'challenge': self.challenge1.id, 'positive': True})
+        self.assertEquals(response.status_code, HTTP_403_FORBIDDEN)
+
+    def test_vote(self):
+        response = self.client.post(reverse('vote'), {'challenge': self.challenge2.id, 'positive': True})
+        self.assertEquals(response.status_code, HTTP_200_OK)
+        self.assertTrue(ChallengeVote.objects.get(user=self.user, challenge=self.challenge2).positive)
+
+    def test_vote_change(self):
+        self.client.post(reverse('vote'), {'challenge': self.challenge2.id, 'positive': True})
+        self.client.post(reverse('vote'), {'challenge': self.challenge2.id, 'positive': False})
+        votes = ChallengeVote.objects.filter(user=self.user, challenge=self.challenge2)
+        self.assertEquals(votes.count(), 1)
+        self.assertFalse(votes.first().positive)
+
+    def test_feedback(self):
+        response = self.client.post(reverse('submit-feedback'), {'challenge': self.challenge2.id, 'feedback': 'a'})
+        self.assertEquals(response.status_code, HTTP_200_OK)
+        self.assertEquals(ChallengeFeedback.objects.get(user=self.user, challenge=self.challenge2).feedback, 'a')
+
+    def test_feedback_change(self):
+        self.client.post(reverse('submit-feedback'), {'challenge': self.challenge2.id, 'feedback': 'a'})
+        self.client.post(reverse('submit-feedback'), {'challenge': self.challenge2.id, 'feedback': 'b'})
+        feedback = ChallengeFeedback.objects.filter(user=self.user, challenge=self.challenge2)
+        self.assertEquals(feedback.count(), 1)
+        self.assertEquals(feedback.first().feedback, 'b')
+
+
 class CategoryViewsetTestCase(ChallengeSetupMixin, APITestCase):
 
     def test_category_list_unauthenticated_permission(self):
@@ -239,6 +275,18 @@ class CategoryViewsetTestCase(ChallengeSetupMixin, APITestCase):
         response = self.client.get(reverse('categories-list'))
         self.assertFalse(response.data[0]['challenges'][0]['unlocked'])
 
+    def test_category_list_used_hint(self):
+        HintUse(hint=self.hint1, team=self.team, user=self.user, challenge=self.challenge1).save()
+        Solve(team=self.team, challenge=self.challenge2, solved_by=self.user, flag='ractf{a}').save()
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse('categories-list'))
+        challenge = [c for c in response.data['d'][0]['challenges'] if c['id'] == self.challenge1.id][0]
+        hints = {hint['id']: hint for hint in challenge['hints']}
+        self.assertTrue(hints[self.hint1.id]['used'])
+        self.assertEquals(hints[self.hint1.id]['text'], 'a')
+        self.assertFalse(hints[self.hint2.id]['used'])
+        self.assertEquals(hints[self.hint2.id]['text'], '')
+
     def test_category_create(self):
         self.user.is_staff = True
         self.user.save()
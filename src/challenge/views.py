@@ -2,7 +2,8 @@ import time
 
 from django.contrib.auth import get_user_model
 from django.db import transaction, models
-from django.db.models import Prefetch, Case, When, Value, Count, Subquery, Q
+from django.db.models import Prefetch, Case, When, Value, Count, Subquery, Q, OuterRef, Exists
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from rest_framework import permissions
 from rest_framework.generics import get_object_or_404
@@ -39,14 +40,17 @@ class CategoryViewset(AdminCreateModelViewSet):
     def get_queryset(self):
         if self.request.user.is_staff and self.request.user.should_deny_admin():
             return Category.objects.none()
+        now = timezone.now()
         team = self.request.user.team
         if team is not None:
             solves = Solve.objects.filter(team=team, correct=True)
             solved_challenges = solves.values_list('challenge')
-            challenges = Challenge.objects.prefetch_related('unlocked_by').annotate(
+            challenges = Challenge.objects.annotate(
                 unlocked=Case(
                     When(auto_unlock=True, then=Value(True)),
-                    When(Q(unlocked_by__in=Subquery(solved_challenges)), then=Value(True)),
+                    When(Exists(Challenge.unlocked_by.through.objects.filter(
+                        to_challenge_id=OuterRef('pk'), from_challenge_id__in=solved_challenges
+                    )), then=Value(True)),
                     default=Value(False),
                     output_field=models.BooleanField()
                 ),
@@ -55,16 +59,19 @@ class CategoryViewset(AdminCreateModelViewSet):
                     default=Value(False),
                     output_field=models.BooleanField()
                 ),
-                solve_count=Count('solves', filter=Q(solves__correct=True)),
+                solve_count=Coalesce(Subquery(
+                    Solve.objects.filter(challenge=OuterRef('pk'), correct=True).values('challenge')
+                    .annotate(count=Count('id')).values('count')
+                ), 0),
                 unlock_time_surpassed=Case(
-                    When(release_time__lte=timezone.now(), then=Value(True)),
+                    When(release_time__lte=now, then=Value(True)),
                     default=Value(False),
                     output_field=models.BooleanField(),
                 )
             )
         else:
             challenges = (
-                Challenge.objects.filter(release_time__lte=timezone.now()).annotate(
+                Challenge.objects.filter(release_time__lte=now).annotate(
                     unlocked=Case(
                         When(auto_unlock=True, then=Value(True)),
                         default=Value(False),
@@ -73,48 +80,42 @@ class CategoryViewset(AdminCreateModelViewSet):
                     solved=Value(False, models.BooleanField()),
                     solve_count=Count('solves'),
                     unlock_time_surpassed=Case(
-                        When(release_time__lte=timezone.now(), then=Value(True)),
+                        When(release_time__lte=now, then=Value(True)),
                         default=Value(False),
                         output_field=models.BooleanField(),
                     )
                 )
             )
+        if time.time() > config.get('end_time'):
+            tags = Tag.objects.all()
+        else:
+            tags = Tag.objects.filter(post_competition=False)
         x = challenges.prefetch_related(
-            Prefetch('hint_set', queryset=Hint.objects.annotate(
-                used=Case(
-                    When(id__in=HintUse.objects.filter(team=team).values_list('hint_id'), then=Value(True)),
-                    default=Value(False),
-                    output_field=models.BooleanField()
-                )), to_attr='hints'),
+            Prefetch('hint_set', queryset=Hint.objects.all(), to_attr='hints'),
             Prefetch('file_set', queryset=File.objects.all(), to_attr='files'),
-            Prefetch('tag_set',
-                     queryset=Tag.objects.all() if time.time() > config.get('end_time') else Tag.objects.filter(
-                         post_competition=False), to_attr='tags'),
-            'unlocks', 'first_blood', 'hint_set__uses')
+            Prefetch('tag_set', queryset=tags, to_attr='tags'),
+            Prefetch('first_blood', queryset=get_user_model().objects.only('id', 'username', 'team')),
+            'unlocks')
         if self.request.user.is_staff:
             categories = Category.objects
         else:
-            categories = Category.objects.filter(release_time__lte=timezone.now())
+            categories = Category.objects.filter(release_time__lte=now)
         qs = categories.prefetch_related(
             Prefetch('category_challenges', queryset=x, to_attr='challenges')
         )
         return qs
 
+    def get_serializer_context(self):
+        context = super(CategoryViewset, self).get_serializer_context()
+        if self.request is None or self.request.method not in permissions.SAFE_METHODS:
+            return context
+        context['used_hints'] = frozenset(
+            HintUse.objects.filter(team_id=self.request.user.team_id).values_list('hint_id', flat=True)
+        )
+        return context
+
     def list(self, request, *args, **kwargs):
-        # This is to fix an issue with django duplicating challenges on .annotate.
-        # If you want to clean this up, good luck.
-        categories = super(CategoryViewset, self).list(request, *args, **kwargs).data
-        for category in categories:
-            unlocked = set()
-            for challenge in category['challenges']:
-                if 'unlocked' in challenge and challenge['unlocked']:
-                    unlocked.add(challenge['id'])
-            new_challenges = []
-            for challenge in category['challenges']:
-                if not (('unlocked' not in challenge or not challenge['unlocked']) and challenge['id'] in unlocked):
-                    new_challenges.append(challenge)
-            category['challenges'] = new_challenges
-        return FormattedResponse(categories)
+        return FormattedResponse(super(CategoryViewset, self).list(request, *args, **kwargs).data)
 
 
 class ChallengeViewset(AdminCreateModelViewSet):
@@ -144,16 +145,12 @@ class ChallengeFeedbackView(APIView):
 
     def post(self, request):
         challenge = get_object_or_404(Challenge, id=request.data.get('challenge'))
-        solve_set = Solve.objects.filter(challenge=challenge)
-
-        if not solve_set.filter(team=request.user.team, correct=True).exists():
+        if not Solve.objects.filter(challenge=challenge, team_id=request.user.team_id, correct=True).exists():
             return FormattedResponse(m='challenge_not_solved', status=HTTP_403_FORBIDDEN)
 
-        current_feedback = ChallengeFeedback.objects.filter(user=request.user, challenge=challenge)
-        if current_feedback.exists():
-            current_feedback.delete()
-
-        ChallengeFeedback(user=request.user, challenge=challenge, feedback=request.data.get("feedback")).save()
+        ChallengeFeedback.objects.update_or_create(
+            user=request.user, challenge=challenge, defaults={'feedback': request.data.get("feedback")}
+        )
         return FormattedResponse(m='feedback_recorded')
 
 
@@ -162,16 +159,12 @@ class ChallengeVoteView(APIView):
 
     def post(self, request):
         challenge = get_object_or_404(Challenge, id=request.data.get('challenge'))
-        solve_set = Solve.objects.filter(challenge=challenge)
-
-        if not solve_set.filter(team=request.user.team, correct=True).exists():
+        if not Solve.objects.filter(challenge=challenge, team_id=request.user.team_id, correct=True).exists():
             return FormattedResponse(m='challenge_not_solved', status=HTTP_403_FORBIDDEN)
 
-        current_vote = ChallengeVote.objects.filter(user=request.user, challenge=challenge)
-        if current_vote.exists():
-            current_vote.delete()
-
-        ChallengeVote(user=request.user, challenge=challenge, positive=request.data.get("positive")).save()
+        ChallengeVote.objects.update_or_create(
+            user=request.user, challenge=challenge, defaults={'positive': request.data.get("positive")}
+        )
         return FormattedResponse(m='vote_recorded')
 
 
@@ -185,22 +178,27 @@ class FlagSubmitView(APIView):
             return FormattedResponse(m='flag_submission_disabled', status=HTTP_403_FORBIDDEN)
 
         with transaction.atomic():
-            team = Team.objects.select_for_update().get(id=request.user.team.id)
+            team = Team.objects.select_for_update().get(id=request.user.team_id)
             user = get_user_model().objects.select_for_update().get(id=request.user.id)
             flag = request.data.get('flag')
             challenge_id = request.data.get('challenge')
             if not flag or not challenge_id:
                 return FormattedResponse(status=HTTP_400_BAD_REQUEST)
 
-            challenge = get_object_or_404(Challenge.objects.select_for_update(), id=challenge_id)
+            challenge = get_object_or_404(Challenge.objects.select_for_update().only(
+                'id', 'name', 'challenge_metadata', 'flag_type', 'flag_metadata', 'points_type', 'score',
+                'auto_unlock', 'first_blood', 'post_score_explanation'
+            ), id=challenge_id)
             solve_set = Solve.objects.filter(challenge=challenge)
-            if solve_set.filter(team=team, correct=True).exists() \
-                    or not challenge.is_unlocked(user):
+            team_solves = solve_set.filter(team=team).aggregate(
+                correct=Count('id', filter=Q(correct=True)),
+                attempts=Count('id'),
+            )
+            if team_solves['correct'] > 0 or not challenge.is_unlocked(user):
                 return FormattedResponse(m='already_solved_challenge', status=HTTP_403_FORBIDDEN)
 
             if challenge.challenge_metadata.get("attempt_limit"):
-                count = solve_set.filter(team=team).count()
-                if count > challenge.challenge_metadata['attempt_limit']:
+                if team_solves['attempts'] > challenge.challenge_metadata['attempt_limit']:
                     flag_reject.send(sender=self.__class__, user=user, team=team, challenge=challenge, flag=flag,
                                      reason='attempt_limit_reached')
                     return FormattedResponse(d={'correct': False}, m='attempt_limit_reached')
@@ -216,12 +214,12 @@ class FlagSubmitView(APIView):
                 return FormattedResponse(d={'correct': False}, m='incorrect_flag')
 
             solve = points_plugin.score(user, team, flag, solve_set)
-            if challenge.first_blood is None:
+            if challenge.first_blood_id is None:
+                Challenge.objects.filter(pk=challenge.pk, first_blood__isnull=True).update(first_blood=user)
                 challenge.first_blood = user
-                challenge.save()
 
-            user.save()
-            team.save()
+            user.save(update_fields=points_plugin.user_score_fields)
+            team.save(update_fields=points_plugin.team_score_fields)
             flag_score.send(sender=self.__class__, user=user, team=team, challenge=challenge, flag=flag, solve=solve)
             ret = {'correct': True}
             if challenge.post_score_explanation:
@@ -237,16 +235,17 @@ class FlagCheckView(APIView):
         if not config.get('enable_flag_submission') or \
                 (not config.get('enable_flag_submission_after_competition') and time.time() > config.get('end_time')):
             return FormattedResponse(m='flag_submission_disabled', status=HTTP_403_FORBIDDEN)
-        team = Team.objects.get(id=request.user.team.id)
+        team = Team.objects.get(id=request.user.team_id)
         user = get_user_model().objects.get(id=request.user.id)
         flag = request.data.get('flag')
         challenge_id = request.data.get('challenge')
         if not flag or not challenge_id:
             return FormattedResponse(status=HTTP_400_BAD_REQUEST)
 
-        challenge = get_object_or_404(Challenge.objects.select_for_update(), id=challenge_id)
-        solve_set = Solve.objects.filter(challenge=challenge)
-        if not solve_set.filter(team=team, correct=True).exists():
+        challenge = get_object_or_404(Challenge.objects.only(
+            'id', 'flag_type', 'flag_metadata', 'post_score_explanation'
+        ), id=challenge_id)
+        if not Solve.objects.filter(challenge=challenge, team=team, correct=True).exists():
             return FormattedResponse(m='havent_solved_challenge', status=HTTP_403_FORBIDDEN)
 
         plugin = plugins.plugins['flag'][challenge.flag_type](challenge)
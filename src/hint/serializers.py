@@ -28,13 +28,15 @@ class HintSerializer(serializers.ModelSerializer):
         if (
             self.context["request"].user.is_staff
             and not self.context["request"].user.should_deny_admin()
-        ) or instance.used:
+        ) or self.get_used(instance):
             return instance.text
         else:
             return ""
 
     def get_used(self, instance):
-        return instance.used
+        if "used_hints" in self.context:
+            return instance.id in self.context["used_hints"]
+        return is_used(self.context, instance)
 
 
 class CreateHintSerializer(serializers.ModelSerializer):
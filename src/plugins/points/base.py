@@ -12,6 +12,9 @@ from hint.models import HintUse
 class PointsPlugin(abc.ABC):
     plugin_type = 'points'
     recalculate_type = 'none'
+    # Columns score() may change on the user and team, saved with update_fields
+    user_score_fields = ('points', 'leaderboard_points', 'last_score')
+    team_score_fields = ('points', 'leaderboard_points', 'last_score')
 
     def __init__(self, challenge):
         self.challenge = challenge
@@ -35,7 +38,7 @@ class PointsPlugin(abc.ABC):
         scored = config.get('end_time') >= time.time() and config.get('enable_scoring')
         score = Score(team=team, reason='challenge', points=points, penalty=deducted, leaderboard=scored, user=user)
         score.save()
-        solve = Solve(team=team, solved_by=user, challenge=challenge, first_blood=challenge.first_blood is None,
+        solve = Solve(team=team, solved_by=user, challenge=challenge, first_blood=challenge.first_blood_id is None,
                       flag=flag, score=score)
         solve.save()
         user.points += (points - deducted)
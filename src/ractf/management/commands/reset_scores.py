@@ -1,7 +1,10 @@
 from django.contrib.auth import get_user_model
 from django.core.management import BaseCommand
+from django.db.models.signals import post_delete
 
 from challenge.models import Score, Solve, Challenge
+from stats.models import ChallengeSolveCounter
+from stats.signals import on_solve_delete
 from team.models import Team
 
 
@@ -9,7 +12,13 @@ class Command(BaseCommand):
     help = "Removes all scores from the database"
 
     def handle(self, *args, **options):
-        Solve.objects.all().delete()
+        # Without the per-row counter receiver this is a single DELETE
+        post_delete.disconnect(on_solve_delete, sender=Solve)
+        try:
+            Solve.objects.all().delete()
+        finally:
+            post_delete.connect(on_solve_delete, sender=Solve)
+        ChallengeSolveCounter.objects.update(correct=0, incorrect=0)
         Score.objects.all().delete()
         for team in Team.objects.all():
             team.points = 0
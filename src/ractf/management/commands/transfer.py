@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.core.management import BaseCommand
+from django.core.management import BaseCommand, CommandError
 
 from team.models import Team
 
@@ -12,7 +12,8 @@ class Command(BaseCommand):
         parser.add_argument('team_id', type=int)
 
     def handle(self, *args, **options):
-        user = get_user_model().objects.get(pk=options['user_id'])
-        team = Team.objects.get(pk=options['team_id'])
-        team.owner = user
-        team.save()
+        if not get_user_model().objects.filter(pk=options['user_id']).exists():
+            raise CommandError("User %d does not exist" % options['user_id'])
+        updated = Team.objects.filter(pk=options['team_id']).update(owner_id=options['user_id'])
+        if updated == 0:
+            raise CommandError("Team %d does not exist" % options['team_id'])
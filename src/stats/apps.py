@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class StatsConfig(AppConfig):
     name = "stats"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        import stats.signals
@@ -0,0 +1,37 @@
+# Generated by Django 3.0.5 on 2026-10-14 15:37
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def populate_solve_counters(apps, schema_editor):
+    Solve = apps.get_model('challenge', 'Solve')
+    ChallengeSolveCounter = apps.get_model('stats', 'ChallengeSolveCounter')
+    counters = {}
+    for challenge_id, correct, count in Solve.objects.order_by().values_list('challenge', 'correct').annotate(
+            count=Count('id')):
+        counter = counters.setdefault(challenge_id, ChallengeSolveCounter(challenge_id=challenge_id))
+        setattr(counter, 'correct' if correct else 'incorrect', count)
+    ChallengeSolveCounter.objects.bulk_create(counters.values())
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('challenge', '0007_unique_vote_feedback'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChallengeSolveCounter',
+            fields=[
+                ('challenge', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='solve_counter', serialize=False, to='challenge.Challenge')),
+                ('correct', models.IntegerField(default=0)),
+                ('incorrect', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_solve_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,10 @@
+from django.db import models
+from django.db.models import CASCADE
+
+from challenge.models import Challenge
+
+
+class ChallengeSolveCounter(models.Model):
+    challenge = models.OneToOneField(Challenge, primary_key=True, related_name="solve_counter", on_delete=CASCADE)
+    correct = models.IntegerField(default=0)
+    incorrect = models.IntegerField(default=0)
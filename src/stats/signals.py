@@ -0,0 +1,35 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from backend.signals import flag_score
+from challenge.models import Solve
+from stats.models import ChallengeSolveCounter
+
+STATS_CACHE_KEY = 'stats'
+STATS_CACHE_TIMEOUT = 15
+
+
+def update_solve_counter(solve, delta):
+    field = "correct" if solve.correct else "incorrect"
+    counter = ChallengeSolveCounter.objects.filter(challenge_id=solve.challenge_id)
+    if not counter.update(**{field: F(field) + delta}) and delta > 0:
+        ChallengeSolveCounter.objects.get_or_create(challenge_id=solve.challenge_id)
+        counter.update(**{field: F(field) + delta})
+
+
+@receiver(flag_score)
+def on_flag_score(**kwargs):
+    cache.delete(STATS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Solve)
+def on_solve_create(sender, instance, created, **kwargs):
+    if created:
+        update_solve_counter(instance, 1)
+
+
+@receiver(post_delete, sender=Solve)
+def on_solve_delete(sender, instance, **kwargs):
+    update_solve_counter(instance, -1)
@@ -1,8 +1,13 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.reverse import reverse
-from rest_framework.status import HTTP_200_OK
+from rest_framework.status import HTTP_200_OK, HTTP_401_UNAUTHORIZED
 from rest_framework.test import APITestCase
 
+from backend.signals import flag_score
+from challenge.models import Category, Challenge, Solve, Score
+from team.models import Team
+
 
 class CountdownTestCase(APITestCase):
     def test_unauthed(self):
@@ -19,7 +24,30 @@ class CountdownTestCase(APITestCase):
         self.assertEquals(response.status_code, HTTP_200_OK)
 
 
-class StatsTestCase(APITestCase):
+class StatsSetupMixin:
+    def setUp(self):
+        cache.clear()
+        category = Category(name="test", display_order=0, contained_type="test", description="")
+        category.save()
+        self.challenge1 = Challenge(name="test1", category=category, description="a", challenge_type="basic",
+                                    challenge_metadata={}, flag_type="plaintext", flag_metadata={"flag": "ractf{a}"},
+                                    author="dave", score=1000)
+        self.challenge1.save()
+        self.challenge2 = Challenge(name="test2", category=category, description="a", challenge_type="basic",
+                                    challenge_metadata={}, flag_type="plaintext", flag_metadata={"flag": "ractf{a}"},
+                                    author="dave", score=1000)
+        self.challenge2.save()
+        self.user = get_user_model()(username="stats-admin", email="stats-admin@example.org", is_staff=True)
+        self.user.save()
+        Solve(challenge=self.challenge1, solved_by=self.user, flag="ractf{a}").save()
+        Solve(challenge=self.challenge1, solved_by=self.user, flag="ractf{b}", correct=False).save()
+        Solve(challenge=self.challenge1, solved_by=self.user, flag="ractf{c}", correct=False).save()
+        Team(name="team1", password="password", owner=self.user, points=100).save()
+        Team(name="team2", password="password", owner=self.user, points=100).save()
+        Team(name="team3", password="password", owner=self.user).save()
+
+
+class StatsTestCase(StatsSetupMixin, APITestCase):
     def test_unauthed(self):
         response = self.client.get(reverse("stats"))
         self.assertEquals(response.status_code, HTTP_200_OK)
@@ -31,6 +59,30 @@ class StatsTestCase(APITestCase):
         response = self.client.get(reverse("stats"))
         self.assertEquals(response.status_code, HTTP_200_OK)
 
+    def test_solve_counts(self):
+        response = self.client.get(reverse("stats"))
+        self.assertEquals(response.data["d"]["solve_count"], 3)
+        self.assertEquals(response.data["d"]["correct_solve_count"], 1)
+
+    def test_solve_counts_cached(self):
+        self.client.get(reverse("stats"))
+        Solve(challenge=self.challenge2, solved_by=self.user, flag="ractf{a}").save()
+        response = self.client.get(reverse("stats"))
+        self.assertEquals(response.data["d"]["correct_solve_count"], 1)
+
+    def test_solve_counts_cache_cleared_on_score(self):
+        self.client.get(reverse("stats"))
+        team = Team.objects.get(name="team1")
+        score = Score(team=team, user=self.user, reason="challenge", points=1000)
+        score.save()
+        solve = Solve(team=team, challenge=self.challenge2, solved_by=self.user, flag="ractf{a}", score=score)
+        solve.save()
+        flag_score.send(sender=self.__class__, user=self.user, team=team, challenge=self.challenge2,
+                        flag="ractf{a}", solve=solve)
+        response = self.client.get(reverse("stats"))
+        self.assertIsNotNone(response.data["d"])
+        self.assertEquals(response.data["d"]["correct_solve_count"], 2)
+
 
 class CommitTestCase(APITestCase):
     def test_unauthed(self):
@@ -43,3 +95,28 @@ class CommitTestCase(APITestCase):
         self.client.force_authenticate(user)
         response = self.client.get(reverse("version"))
         self.assertEquals(response.status_code, HTTP_200_OK)
+
+
+class FullStatsTestCase(StatsSetupMixin, APITestCase):
+    def test_unauthed(self):
+        response = self.client.get(reverse("full"))
+        self.assertEquals(response.status_code, HTTP_401_UNAUTHORIZED)
+
+    def test_challenge_counts(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse("full"))
+        challenges = response.data["d"]["challenges"]
+        self.assertEquals(challenges[self.challenge1.id], {"correct": 1, "incorrect": 2})
+        self.assertEquals(challenges[self.challenge2.id], {"correct": 0, "incorrect": 0})
+
+    def test_team_point_distribution(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse("full"))
+        self.assertEquals(response.data["d"]["team_point_distribution"], {0: 1, 100: 2})
+
+    def test_challenge_counts_solve_deleted(self):
+        Solve.objects.filter(challenge=self.challenge1, correct=False).first().delete()
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse("full"))
+        challenges = response.data["d"]["challenges"]
+        self.assertEquals(challenges[self.challenge1.id], {"correct": 1, "incorrect": 1})
@@ -1,18 +1,35 @@
 import os
+import subprocess
 from datetime import timezone, datetime
 
 from django.contrib.auth import get_user_model
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db.models import Sum, Count
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAdminUser
 
 from member.models import UserIP
 from backend.response import FormattedResponse
-from challenge.models import Solve, Score, Challenge
+from challenge.models import Score, Challenge
 from config import config
+from stats.models import ChallengeSolveCounter
+from stats.signals import STATS_CACHE_KEY, STATS_CACHE_TIMEOUT
 from team.models import Team
 
 
+def get_commit_hash():
+    commit_hash = os.getenv('GIT_COMMIT')
+    if commit_hash:
+        return commit_hash
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+COMMIT_HASH = get_commit_hash()
+
+
 @api_view(['GET'])
 def countdown(request):
     return FormattedResponse({
@@ -23,37 +40,44 @@ def countdown(request):
     })
 
 
-@api_view(['GET'])
-def stats(request):
+def get_stats():
     users = get_user_model().objects.count()
     teams = Team.objects.count()
     if users > 0 and teams > 0:
         average = users / teams
     else:
         average = 0
-    return FormattedResponse({
+    solves = ChallengeSolveCounter.objects.aggregate(correct=Sum('correct'), incorrect=Sum('incorrect'))
+    correct = solves["correct"] or 0
+    return {
         "user_count": users,
         "team_count": teams,
-        "solve_count": Solve.objects.count(),
-        "correct_solve_count": Solve.objects.filter(correct=True).count(),
+        "solve_count": correct + (solves["incorrect"] or 0),
+        "correct_solve_count": correct,
         "avg_members": average,
-    })
+    }
+
+
+@api_view(['GET'])
+def stats(request):
+    value = cache.get(STATS_CACHE_KEY)
+    if value is None:
+        value = get_stats()
+        cache.set(STATS_CACHE_KEY, value, STATS_CACHE_TIMEOUT)
+    return FormattedResponse(value)
 
 
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def full(request):
     challenge_data = {}
-    for challenge in Challenge.objects.all():
-        challenge_data[challenge.id] = {}
-        challenge_data[challenge.id]["correct"] = challenge.solves.filter(correct=True).count()
-        challenge_data[challenge.id]["incorrect"] = challenge.solves.filter(correct=False).count()
+    solve_counts = Challenge.objects.values_list('id', 'solve_counter__correct', 'solve_counter__incorrect')
+    for challenge_id, correct, incorrect in solve_counts:
+        challenge_data[challenge_id] = {"correct": correct or 0, "incorrect": incorrect or 0}
 
     point_distribution = {}
-    for team in Team.objects.all():
-        if not point_distribution.get(team.points):
-            point_distribution[team.points] = 0
-        point_distribution[team.points] += 1
+    for points, count in Team.objects.order_by().values_list('points').annotate(count=Count('id')):
+        point_distribution[points] = count
 
     return FormattedResponse({
         "users": {
@@ -70,8 +94,4 @@ def full(request):
 
 @api_view(['GET'])
 def version(request):
-    return FormattedResponse(
-        {
-            "commit_hash": os.popen("git rev-parse HEAD").read().strip()
-        }
-    )
+    return FormattedResponse({"commit_hash": COMMIT_HASH})
@@ -0,0 +1,18 @@
+# Generated by Django 3.0.5 on 2026-10-14 15:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('team', '0003_team_size_limit_exempt'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='team',
+            name='points',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+    ]
@@ -15,7 +15,7 @@ class Team(models.Model):
         get_user_model(), on_delete=CASCADE, related_name="owned_team"
     )
     description = models.TextField(blank=True, max_length=400)
-    points = models.IntegerField(default=0)
+    points = models.IntegerField(default=0, db_index=True)
     leaderboard_points = models.IntegerField(default=0)
     last_score = models.DateTimeField(default=timezone.now)
     size_limit_exempt = models.BooleanField(default=False)
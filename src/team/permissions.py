@@ -13,7 +13,7 @@ class IsTeamOwnerOrReadOnly(permissions.BasePermission):
 
 class HasTeam(permissions.BasePermission):
     def has_permission(self, request, view):
-        return request.user.team is not None
+        return request.user.team_id is not None
 
 
 class TeamsEnabled(permissions.BasePermission):